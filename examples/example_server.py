@@ -30,6 +30,8 @@
 import asyncio
 import enum
 import logging
+import logging.handlers
+import queue
 import signal
 from typing import Tuple
 
@@ -42,6 +44,13 @@ class Foo(enum.Enum):
 
 
 class Total(aiokatcp.SimpleAggregateSensor):
+    """Sum of all the integer sensors in the target.
+
+    The sum is kept as a running total which is adjusted as individual
+    readings are added or removed, so an update costs the same no matter how
+    many sensors are being aggregated.
+    """
+
     def __init__(self, target):
         self._total = 0
         super().__init__(target=target, sensor_type=int, name="total")
@@ -78,6 +87,8 @@ class Server(aiokatcp.DeviceServer):
         self.sensors.add(sensor)
         sensor = aiokatcp.Sensor(Foo, "foo", "nonsense")
         self.sensors.add(sensor)
+        # The service task sends the same message every time, so build it once
+        self._hello_msg = aiokatcp.Message.inform("hello", "Hi I am a service task")
         self.add_service_task(asyncio.create_task(self._service_task()))
 
         total_sensor = Total(self.sensors)
@@ -108,7 +119,7 @@ class Server(aiokatcp.DeviceServer):
         """Example service task that broadcasts to clients."""
         while True:
             await asyncio.sleep(10)
-            self.mass_inform("hello", "Hi I am a service task")
+            self.mass_send_message(self._hello_msg)
 
     async def _alter_sensors(self) -> None:
         """Example service task that adds and removes a fixed sensor.
@@ -127,15 +138,25 @@ class Server(aiokatcp.DeviceServer):
             self.mass_inform("interface-changed", "sensor", "fixed-value", "removed")
 
 
-async def main():
-    logging.basicConfig(level=logging.INFO)
-    server = Server("localhost", 4444)
-    handler = Server.LogHandler(server)
-    logging.getLogger().addHandler(handler)
-    await server.start()
-    asyncio.get_event_loop().add_signal_handler(signal.SIGINT, server.halt)
-    await server.join()
+async def main() -> None:
+    # Write log messages to the console from a separate thread, so that the
+    # event loop does not block on console I/O.
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    try:
+        server = Server("localhost", 4444)
+        # This must not go via the queue, because it sends informs to
+        # clients and so needs to run on the event loop thread.
+        handler = Server.LogHandler(server)
+        logging.getLogger().addHandler(handler)
+        await server.start()
+        asyncio.get_event_loop().add_signal_handler(signal.SIGINT, server.halt)
+        await server.join()
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
-    asyncio.run(main(), debug=True)
+    asyncio.run(main())
@@ -33,6 +33,7 @@ import inspect
 import logging
 import random
 import re
+import sys
 import time
 import warnings
 from collections import OrderedDict
@@ -79,6 +80,8 @@ class _InformCallback(_Handler):
 
 
 class _PendingRequest:
+    __slots__ = ["name", "mid", "informs", "reply"]
+
     def __init__(self, name: str, mid: Optional[int], loop: asyncio.AbstractEventLoop) -> None:
         self.name = name
         self.mid = mid
@@ -99,7 +102,8 @@ class ClientMeta(type):
         inform_handlers = getattr(result, "_inform_handlers")
         for key, value in namespace.items():
             if key.startswith("inform_") and inspect.isfunction(value):
-                request_name = key[7:].replace("_", "-")
+                # Interned to match the names produced by Message.parse
+                request_name = sys.intern(key[7:].replace("_", "-"))
                 inform_handlers[request_name] = mcs._wrap_inform(request_name, value)
         return result
 
@@ -387,7 +391,7 @@ class Client(metaclass=ClientMeta):
         """Make a single attempt to connect and run the connection if successful."""
         # Open the connection. Based on asyncio.open_connection.
         reader = asyncio.StreamReader(limit=self._limit)
-        protocol = connection.ConvertCRProtocol(reader)
+        protocol = asyncio.StreamReaderProtocol(reader)
         try:
             transport, _ = await self.loop.create_connection(lambda: protocol, self.host, self.port)
         except OSError as error:
@@ -397,7 +401,7 @@ class Client(metaclass=ClientMeta):
         writer = asyncio.StreamWriter(
             transport, protocol, reader, self.loop  # type: ignore[arg-type]
         )
-        conn = connection.Connection(self, reader, writer, False)
+        conn = connection.Connection(self, reader, writer, False, self._limit)
         self._set_connection(conn)
         # Process replies until connection closes. _on_connected is
         # called by the version-info inform handler.
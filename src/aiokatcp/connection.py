@@ -31,16 +31,20 @@ import inspect
 import ipaddress
 import logging
 import re
+import sys
 import time
 from typing import Any, Callable, Iterable, Optional, TypeVar
 
 import decorator
+import katcp_codec
 from typing_extensions import Protocol, Self
 
 from . import core
 
 logger = logging.getLogger(__name__)
 DEFAULT_LIMIT = 16 * 1024**2
+#: Maximum number of bytes to take from the stream in one read
+_READ_SIZE = 256 * 1024
 _BLANK_RE = re.compile(rb"^[ \t]*[\r\n]?$")
 # typing.Protocol requires a contravariant typevar
 _C_contra = TypeVar("_C_contra", bound="Connection", contravariant=True)
@@ -131,15 +135,20 @@ class Connection:
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
         is_server: bool,
+        limit: int = DEFAULT_LIMIT,
     ) -> None:
         self.owner = owner
         self.reader = reader
+        # There is no need to set TCP_NODELAY on the socket: asyncio's TCP
+        # transports disable Nagle's algorithm themselves, so small replies
+        # are not held back waiting for an ACK.
         self.writer = writer
         self._writer_closing = False
         host, port, *_ = writer.get_extra_info("peername")
         self.address = core.Address(ipaddress.ip_address(host), port)
         self._drain_lock = asyncio.Lock()
         self.is_server = is_server
+        self._limit = limit
         self.logger = ConnectionLoggerAdapter(logger, dict(address=self.address))
         self._task = self.owner.loop.create_task(self._run())
         self._task.add_done_callback(self._done_callback)
@@ -150,8 +159,8 @@ class Connection:
         self.writer.close()
         self._writer_closing = True
 
-    def write_messages(self, msgs: Iterable[core.Message]) -> None:
-        """Write a stream of messages to the connection.
+    def _write_raw(self, raw: bytes) -> None:
+        """Write already-serialised messages to the connection.
 
         Connection errors are logged and swallowed.
         """
@@ -164,19 +173,31 @@ class Connection:
             # (see Github issue #11).
             if self.writer.transport.is_closing():
                 raise ConnectionResetError("Connection lost")
-            raw = b"".join(bytes(msg) for msg in msgs)
             self.writer.write(raw)
             self.logger.debug("Sent message %r", raw)
         except ConnectionError as error:
             self.logger.warning("Connection closed before message could be sent: %s", error)
             self._close_writer()
 
+    def write_messages(self, msgs: Iterable[core.Message]) -> None:
+        """Write a stream of messages to the connection.
+
+        Connection errors are logged and swallowed.
+        """
+        if self._writer_closing:
+            return  # Don't waste time serialising the messages
+        self._write_raw(b"".join(map(bytes, msgs)))
+
     def write_message(self, msg: core.Message) -> None:
         """Write a message to the connection.
 
         Connection errors are logged and swallowed.
         """
-        self.write_messages([msg])
+        if self._writer_closing:
+            return  # Don't waste time serialising the message
+        # Each message is already serialised into a single buffer, so there
+        # is no need to join it with anything.
+        self._write_raw(bytes(msg))
 
     async def drain(self) -> None:
         """Block until the outgoing write buffer is small enough."""
@@ -194,29 +215,45 @@ class Connection:
 
     # The self: Self is needed due to https://github.com/python/mypy/issues/17723
     async def _run(self: Self) -> None:
+        # A single parser is kept for the lifetime of the connection and fed
+        # whatever chunks arrive, rather than splitting the stream into lines
+        # first and then parsing each line separately. This avoids copying
+        # every line out of the stream buffer and constructing a new parser
+        # per message. The parser also handles carriage returns itself.
+        parser = katcp_codec.Parser(self._limit)
         while True:
-            # If the output buffer gets too full, pause processing requests
-            await self.drain()
             try:
-                msg = await read_message(self.reader)
-            except core.KatcpSyntaxError as error:
-                self.logger.warning("Malformed message received", exc_info=True)
-                if self.is_server:
-                    # TODO: #log informs are supposed to go to all clients
-                    self.write_message(
-                        core.Message.inform("log", "error", time.time(), __name__, str(error))
-                    )
+                data = await self.reader.read(_READ_SIZE)
             except ConnectionResetError:
                 # Client closed connection without consuming everything we sent it.
                 break
-            else:
-                if msg is None:  # EOF received
-                    break
+            if not data:  # EOF received
+                # Terminate any leftover data to find out whether it is just
+                # whitespace (which parses to nothing and is ignored). Anything
+                # else is an error, even if it would be a valid message.
+                if parser.buffer_size > 0 and parser.append(b"\n"):
+                    self._malformed(core.KatcpSyntaxError("Message is not terminated by newline"))
+                break
+            for item in parser.append(data):
+                # If the output buffer gets too full, pause processing requests
+                await self.drain()
+                if isinstance(item, ValueError):
+                    self._malformed(core.KatcpSyntaxError(str(item)))
+                    continue
+                msg = core.Message._from_codec(item)
                 if self.logger.isEnabledFor(logging.DEBUG):
                     # Check isEnabledFor because bytes(msg) can be expensive
                     self.logger.debug("Received message %r", bytes(msg))
                 await self.owner.handle_message(self, msg)
 
+    def _malformed(self, error: core.KatcpSyntaxError) -> None:
+        self.logger.warning("Malformed message received: %s", error)
+        if self.is_server:
+            # TODO: #log informs are supposed to go to all clients
+            self.write_message(
+                core.Message.inform("log", "error", time.time(), __name__, str(error))
+            )
+
     def _done_callback(self, task: asyncio.Future) -> None:
         self._closed_event.set()
         if not task.cancelled():
@@ -304,6 +341,19 @@ def wrap_handler(name: str, handler: Callable, fixed: int) -> Callable:
         raise TypeError(f"Handler must accept at least {fixed} positional argument(s)")
 
     pos_decoders = [_parameter_decoder(arg) for arg in pos[fixed:]]
+    # Binding to the signature is slow, so work out up front how many
+    # arguments are needed for it to succeed, and only bind (to produce the
+    # error message) when there are too few. Positional parameters without
+    # defaults cannot follow ones with defaults, so counting them suffices.
+    # If there is a required keyword-only parameter, binding always fails.
+    if any(
+        parameter.kind == inspect.Parameter.KEYWORD_ONLY
+        and parameter.default is inspect.Parameter.empty
+        for parameter in sig.parameters.values()
+    ):
+        min_args = sys.maxsize
+    else:
+        min_args = sum(parameter.default is inspect.Parameter.empty for parameter in pos)
     if var_pos is not None:
         var_pos_decoder = _parameter_decoder(var_pos)
     else:
@@ -327,10 +377,11 @@ def wrap_handler(name: str, handler: Callable, fixed: int) -> Callable:
         # Validate the arguments against sig. We could catch TypeError when
         # we invoke the function, but then we would also catch TypeErrors
         # raised from inside the implementation.
-        try:
-            sig.bind(*args)
-        except TypeError as error:
-            raise FailReply(str(error)) from error  # e.g. too few arguments
+        if len(args) < min_args:
+            try:
+                sig.bind(*args)
+            except TypeError as error:
+                raise FailReply(str(error)) from error  # e.g. too few arguments
         return args
 
     if inspect.iscoroutinefunction(handler):
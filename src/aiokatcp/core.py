@@ -31,16 +31,19 @@ import ipaddress
 import logging
 import numbers
 import re
+import socket
 import sys
 import typing
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Dict,
     Generic,
     List,
     Match,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -74,7 +77,7 @@ class Address:
         Port number
     """
 
-    __slots__ = ["_host", "_port"]
+    __slots__ = ["_host", "_port", "_str"]
     _IPV4_RE = re.compile(r"^(?P<host>[^:]+)(:(?P<port>\d+))?$")
     _IPV6_RE = re.compile(r"^\[(?P<host>[^]]+)\](:(?P<port>\d+))?$")
 
@@ -83,6 +86,11 @@ class Address:
             raise TypeError(f"{host} is not of either {typing.get_args(_IPAddress)}")
         self._host = host
         self._port = port
+        # Addresses are immutable, so the string form is computed on first
+        # use and then cached (the address of a connection is formatted into
+        # every log message for that connection). The hash is not cached,
+        # because it depends on the hash seed and so must not be pickled.
+        self._str: Optional[str] = None
 
     @property
     def host(self) -> _IPAddress:
@@ -95,15 +103,18 @@ class Address:
         return self._port
 
     def __str__(self) -> str:
+        if self._str is not None:
+            return self._str
         if isinstance(self._host, ipaddress.IPv4Address):
             prefix = str(self._host)
         else:
             prefix = "[" + str(self._host) + "]"
         if self._port is not None:
             # noqa is to work around https://github.com/PyCQA/pycodestyle/issues/1178
-            return f"{prefix}:{self._port}"  # noqa: E231
+            self._str = f"{prefix}:{self._port}"  # noqa: E231
         else:
-            return prefix
+            self._str = prefix
+        return self._str
 
     def __bytes__(self) -> bytes:
         """Encode the address for katcp protocol"""
@@ -130,13 +141,26 @@ class Address:
             If `raw` does not represent a valid address
         """
         text = raw.decode("utf-8")
+        # The hosts are first converted with inet_pton, which is much faster
+        # than having ipaddress parse the string in Python. Anything it
+        # rejects is passed to ipaddress, which either accepts it (e.g. an
+        # IPv6 scope ID) or raises a descriptive ValueError.
         match = cls._IPV6_RE.match(text)
         if match:
-            host: _IPAddress = ipaddress.IPv6Address(match.group("host"))
+            host: _IPAddress
+            host_text = match.group("host")
+            try:
+                host = ipaddress.IPv6Address(socket.inet_pton(socket.AF_INET6, host_text))
+            except (OSError, ValueError):
+                host = ipaddress.IPv6Address(host_text)
         else:
             match = cls._IPV4_RE.match(text)
             if match:
-                host = ipaddress.IPv4Address(match.group("host"))
+                host_text = match.group("host")
+                try:
+                    host = ipaddress.IPv4Address(socket.inet_pton(socket.AF_INET, host_text))
+                except (OSError, ValueError):
+                    host = ipaddress.IPv4Address(host_text)
             else:
                 raise ValueError(f"could not parse '{text}' as an address")
         port = match.group("port")
@@ -156,6 +180,18 @@ class Address:
     def __hash__(self) -> int:
         return hash((self._host, self._port))
 
+    # Pickle only the host and port, in the same format as the default
+    # pickling of slots. This keeps the cached string out of the pickle, and
+    # allows pickles from versions without the cache to be loaded.
+    def __getstate__(self) -> Tuple[None, Dict[str, Any]]:
+        return (None, {"_host": self._host, "_port": self._port})
+
+    def __setstate__(self, state: Tuple[None, Dict[str, Any]]) -> None:
+        slots = state[1]
+        self._host = slots["_host"]
+        self._port = slots["_port"]
+        self._str = None
+
 
 class Timestamp(float):
     """A katcp timestamp.
@@ -234,6 +270,12 @@ class TypeInfo(Generic[_T]):
 
 
 _types: List[TypeInfo] = []
+#: Memoised results of :func:`get_type`. This is cleared by
+#: :func:`register_type`, as a new registration can change the results.
+_type_cache: Dict[type, TypeInfo] = {}
+#: Jump table from the exact type of a value to its encoder, populated on
+#: demand by :func:`encode`. This is also cleared by :func:`register_type`.
+_encoder_cache: Dict[type, Callable[[Any], bytes]] = {}
 
 
 def register_type(
@@ -267,7 +309,8 @@ def register_type(
     for info in _types:
         if info.type_ == type_:
             raise ValueError(f"{type_} is already registered")
-    get_type.cache_clear()  # type: ignore
+    _type_cache.clear()
+    _encoder_cache.clear()
     _get_decoder.cache_clear()  # type: ignore
     _types.append(TypeInfo(type_, name, encode, get_decoder, default))
 
@@ -283,29 +326,47 @@ def get_type(type_: Type[_T]) -> TypeInfo[_T]:
     TypeError
         if none of the registrations match `type_`
     """
+    info = _type_cache.get(type_)
+    if info is not None:
+        return info
     for info in reversed(_types):
         if issubclass(type_, info.type_):
+            _type_cache[type_] = info
             return info
     raise TypeError(f"{type_} is not registered")
 
 
 def _get_decoder_bool(cls: type) -> Callable[[bytes], bool]:
+    lookup = {b"0": cls(False), b"1": cls(True)}
+
     def decode(raw: bytes) -> bool:
-        if raw == b"1":
-            return cls(True)
-        elif raw == b"0":
-            return cls(False)
-        else:
-            raise ValueError(f"boolean must be 0 or 1, not {raw!r}")
+        try:
+            return lookup[raw]
+        except KeyError:
+            raise ValueError(f"boolean must be 0 or 1, not {raw!r}") from None
 
     return decode
 
 
+#: Memoised results of :func:`_encode_enum`. It is indexed first by class,
+#: because members of different :class:`enum.IntEnum` classes can compare equal.
+_enum_encodings: Dict[type, Dict[enum.Enum, bytes]] = {}
+
+
 def _encode_enum(value: enum.Enum) -> bytes:
+    encodings = _enum_encodings.get(type(value))
+    if encodings is None:
+        encodings = _enum_encodings[type(value)] = {}
+    cached = encodings.get(value)
+    if cached is not None:
+        return cached
+    raw: bytes
     if hasattr(value, "katcp_value"):
-        return getattr(value, "katcp_value")
+        raw = getattr(value, "katcp_value")
     else:
-        return value.name.encode("ascii").lower().replace(b"_", b"-")
+        raw = value.name.encode("ascii").lower().replace(b"_", b"-")
+    encodings[value] = raw
+    return raw
 
 
 def _get_decoder_enum(cls: Type[_E]) -> Callable[[bytes], _E]:
@@ -371,7 +432,12 @@ def encode(value: Any) -> bytes:
     --------
     :func:`register_type`
     """
-    return get_type(type(value)).encode(value)
+    cls = type(value)
+    encoder = _encoder_cache.get(cls)
+    if encoder is None:
+        encoder = get_type(cls).encode
+        _encoder_cache[cls] = encoder
+    return encoder(value)
 
 
 def _union_args(cls: Any) -> Optional[Tuple[Type, ...]]:
@@ -425,7 +491,6 @@ def get_decoder(cls: Type[_T]) -> Callable[[bytes], _T]:
 if not TYPE_CHECKING:
     # This is hidden from type checking because otherwise mypy keeps
     # complaining that Type is not Hashable.
-    get_type = functools.lru_cache(get_type)
     get_decoder = functools.lru_cache(get_decoder)
     _get_decoder = get_decoder  # Used in register_type to work around a shadowing issue
 
@@ -472,7 +537,8 @@ class Message:
 
     Type: TypeAlias = katcp_codec.MessageType
 
-    _NAME_RE = re.compile("^[A-Za-z][A-Za-z0-9-]*$", re.ASCII)
+    # Used with fullmatch, which (unlike ^...$) rejects a trailing newline
+    _NAME_RE = re.compile("[A-Za-z][A-Za-z0-9-]*", re.ASCII)
     #: Characters that must be escaped in an argument
     _ESCAPE_RE = re.compile(rb"[\\ \0\n\r\x1b\t]")
     _UNESCAPE_RE = re.compile(rb"\\(.)?")  # ? so that it also matches trailing backslash
@@ -487,16 +553,30 @@ class Message:
         b"t": b"\t",
         b"@": b"",
     }
-    _REVERSE_ESCAPE_LOOKUP = {value: key for (key, value) in _ESCAPE_LOOKUP.items()}
 
     OK = b"ok"
     FAIL = b"fail"
     INVALID = b"invalid"
 
+    #: Interned names of previously parsed messages. Reusing the same string
+    #: object avoids decoding the name and makes handler dictionary lookups
+    #: cheaper (hash is cached and keys compare by identity).
+    _NAME_CACHE: Dict[bytes, str] = {}
+    #: Limit on the size of :attr:`_NAME_CACHE`, to bound memory usage if a
+    #: remote end sends lots of distinct names.
+    _NAME_CACHE_SIZE = 1024
+    #: Names that have already been checked against :attr:`_NAME_RE`. The
+    #: same few names are used over and over, and a set lookup is much
+    #: cheaper than a regex match. It is bounded by :attr:`_NAME_CACHE_SIZE`.
+    _VALID_NAMES: Set[str] = set()
+
     def __init__(self, mtype: Type, name: str, *arguments: Any, mid: Optional[int] = None) -> None:
         self.mtype = mtype
-        if not self._NAME_RE.match(name):
-            raise ValueError(f"name {name} is invalid")
+        if name not in self._VALID_NAMES:
+            if not self._NAME_RE.fullmatch(name):
+                raise ValueError(f"name {name} is invalid")
+            if len(self._VALID_NAMES) < self._NAME_CACHE_SIZE:
+                self._VALID_NAMES.add(name)
         self.name = name
         self.arguments = [encode(arg) for arg in arguments]
         if mid is not None:
@@ -524,11 +604,6 @@ class Message:
     def inform_reply(cls, msg: "Message", *arguments: Any) -> "Message":
         return cls(cls.Type.INFORM, msg.name, *arguments, mid=msg.mid)
 
-    @classmethod
-    def _escape_match(cls, match: Match[bytes]):
-        """Given a re.Match object matching :attr:`_ESCAPE_RE`, return the escape code for it."""
-        return b"\\" + cls._REVERSE_ESCAPE_LOOKUP[match.group()]
-
     @classmethod
     def _unescape_match(cls, match: Match[bytes]):
         char = match.group(1)
@@ -544,8 +619,14 @@ class Message:
         """Escape special bytes in an argument"""
         if arg == b"":
             return rb"\@"
+        elif not cls._ESCAPE_RE.search(arg):
+            return arg  # Common case: nothing to escape
         else:
-            return cls._ESCAPE_RE.sub(cls._escape_match, arg)
+            # Let katcp-codec do the escaping, which is much faster than
+            # calling back into Python for every special byte. Serialising
+            # gives b"#x " + escaped + b"\n".
+            msg = katcp_codec.Message(cls.Type.INFORM, b"x", None, [arg])
+            return bytes(msg)[3:-1]
 
     @classmethod
     def unescape_argument(cls, arg: bytes) -> bytes:
@@ -553,6 +634,8 @@ class Message:
         # For performance reasons this function is no longer used internally
         # (it's faster to inline it), but it is kept because it is part of
         # the public API.
+        if b"\\" not in arg:
+            return arg  # Common case: nothing to unescape
         return cls._UNESCAPE_RE.sub(cls._unescape_match, arg)
 
     @classmethod
@@ -581,14 +664,32 @@ class Message:
             msg = msgs[0]
             if isinstance(msg, Exception):
                 raise msg
-            # Create the message first without arguments, to avoid the argument
-            # encoding and let us store raw bytes.
-            ret = cls(msg.mtype, msg.name.decode("ascii"), mid=msg.mid)
-            ret.arguments = msg.arguments
-            return ret
+            return cls._from_codec(msg)
         except ValueError as error:
             raise KatcpSyntaxError(str(error), raw) from error
 
+    @classmethod
+    def _from_codec(cls, msg: katcp_codec.Message) -> "Message":
+        """Create a :class:`Message` from one returned by :class:`katcp_codec.Parser`."""
+        # The parser has already validated the name and message ID, and
+        # the arguments are already raw bytes, so bypass the constructor
+        # to avoid repeating the validation and argument encoding.
+        name = cls._NAME_CACHE.get(msg.name)
+        if name is None:
+            name = msg.name.decode("ascii")
+            # Only intern names that go into the cache: on some Python
+            # versions interned strings are never freed, so interning
+            # every name would defeat the bound on the cache size.
+            if len(cls._NAME_CACHE) < cls._NAME_CACHE_SIZE:
+                name = sys.intern(name)
+                cls._NAME_CACHE[msg.name] = name
+        ret = cls.__new__(cls)
+        ret.mtype = msg.mtype
+        ret.name = name
+        ret.arguments = msg.arguments
+        ret.mid = msg.mid
+        return ret
+
     def __bytes__(self) -> bytes:
         """Return Message as serialised for transmission"""
         return bytes(
@@ -636,10 +737,11 @@ register_type(
 register_type(
     numbers.Integral,  # type: ignore
     "integer",
-    lambda value: str(int(value)).encode("ascii"),
+    lambda value: b"%d" % int(value),
     _get_decoder_int,
 )
-register_type(bool, "boolean", lambda value: b"1" if value else b"0", _get_decoder_bool)
+# bool is a subclass of int, so False and True index the tuple directly
+register_type(bool, "boolean", (b"0", b"1").__getitem__, _get_decoder_bool)
 register_type(bytes, "string", lambda value: value, lambda cls: cls)
 register_type(
     str,
@@ -151,7 +151,7 @@ class Sensor(Generic[_T]):
 
         def valid_value(self) -> bool:
             """True if this state is one where the value provided is valid."""
-            return self in {Sensor.Status.NOMINAL, Sensor.Status.WARN, Sensor.Status.ERROR}
+            return self in _VALID_STATUSES
 
     def __init__(
         self,
@@ -314,6 +314,10 @@ class Sensor(Generic[_T]):
         self._classic_observers.discard(observer)  # type: ignore
 
 
+#: Statuses for which :meth:`Sensor.Status.valid_value` is true
+_VALID_STATUSES = frozenset({Sensor.Status.NOMINAL, Sensor.Status.WARN, Sensor.Status.ERROR})
+
+
 class SensorSampler(Generic[_T], metaclass=abc.ABCMeta):
     """Implement the strategies defined by the ``sensor-sampling`` request.
 
@@ -755,7 +759,7 @@ class SensorSet(Mapping[str, Sensor]):
 
     def __contains__(self, s: object) -> bool:
         if isinstance(s, Sensor):
-            return s.name in self._sensors and self._sensors[s.name] is s
+            return self._sensors.get(s.name) is s
         else:
             return s in self._sensors
 
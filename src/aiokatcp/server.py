@@ -32,6 +32,7 @@ import io
 import logging
 import re
 import socket
+import sys
 import time
 import traceback
 from typing import (
@@ -72,7 +73,7 @@ class ClientConnection(connection.Connection):
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
     ) -> None:
-        super().__init__(owner, reader, writer, True)
+        super().__init__(owner, reader, writer, True, owner._limit)
         #: Maps sensors to their samplers, for sensors that are being sampled
         self._samplers: Dict[sensor.Sensor, sensor.SensorSampler] = {}
         #: Protects against concurrent request_sensor_sampling (but not sensor removal)
@@ -206,7 +207,8 @@ class DeviceServerMeta(type):
         request_handlers = getattr(result, "_request_handlers")
         for key, value in namespace.items():
             if key.startswith("request_") and inspect.isfunction(value):
-                request_name = key[8:].replace("_", "-")
+                # Interned to match the names produced by Message.parse
+                request_name = sys.intern(key[8:].replace("_", "-"))
                 if value.__doc__ is None:
                     raise TypeError(f"{key} must have a docstring")
                 request_handlers[request_name] = mcs._wrap_request(request_name, value)
@@ -342,9 +344,10 @@ class DeviceServer(metaclass=DeviceServerMeta):
         """
 
         def factory():
-            # Based on asyncio.start_server, but using ConvertCRProtocol
+            # Based on asyncio.start_server. Carriage returns are handled by
+            # the connection's parser, so ConvertCRProtocol is not needed.
             reader = asyncio.StreamReader(limit=self._limit)
-            protocol = connection.ConvertCRProtocol(reader, self._client_connected_cb)
+            protocol = asyncio.StreamReaderProtocol(reader, self._client_connected_cb)
             return protocol
 
         async with self._server_lock:
@@ -528,7 +531,15 @@ class DeviceServer(metaclass=DeviceServerMeta):
         )
 
     def _write_async_message(self, conn: ClientConnection, msg: core.Message) -> None:
-        conn.write_message(msg)
+        self._write_async_raw(conn, bytes(msg))
+
+    def _write_async_raw(self, conn: ClientConnection, raw: bytes) -> None:
+        """Write an already-serialised asynchronous message.
+
+        This allows a message that is sent to many clients to be serialised
+        only once.
+        """
+        conn._write_raw(raw)
         # ?sensor-sampling with a bulk list of sensors causes large amounts of
         # data (initial sensor values) to be dumped into the stream at once,
         # and it's only drained in batches (for efficiency). So we suspend the
@@ -561,9 +572,9 @@ class DeviceServer(metaclass=DeviceServerMeta):
         request = core.Message.request("version-connect")
         ctx = RequestContext(conn, request)
         self.send_version_info(ctx, send_reply=False)
-        msg = core.Message.inform("client-connected", conn.address)
+        raw = bytes(core.Message.inform("client-connected", conn.address))
         for old_conn in connections:
-            self._write_async_message(old_conn, msg)
+            self._write_async_raw(old_conn, raw)
 
     def _handle_request_done_callback(self, ctx: RequestContext, task: asyncio.Task) -> None:
         """Completion callback for request handlers.
@@ -657,10 +668,25 @@ class DeviceServer(metaclass=DeviceServerMeta):
         *args
             Fields for the inform
         """
-        msg = core.Message.inform(name, *args)
-        # Copy the connection list, because _write_async_message can mutate it.
+        self.mass_send_message(core.Message.inform(name, *args))
+
+    def mass_send_message(self, msg: core.Message) -> None:
+        """Send an asynchronous message to all clients.
+
+        This is a lower-level alternative to :meth:`mass_inform`. It is
+        useful for sending the same message repeatedly, as the message can be
+        constructed once and reused.
+
+        Parameters
+        ----------
+        msg
+            Message to send
+        """
+        # Serialise once rather than once per client
+        raw = bytes(msg)
+        # Copy the connection list, because _write_async_raw can mutate it.
         for conn in list(self._connections):
-            self._write_async_message(conn, msg)
+            self._write_async_raw(conn, raw)
 
     async def request_help(self, ctx: RequestContext, name: Optional[str] = None) -> None:
         """Return help on the available requests.
@@ -34,7 +34,7 @@ from unittest import mock
 import async_solipsism
 import pytest
 
-from aiokatcp.connection import Connection, read_message
+from aiokatcp.connection import Connection, FailReply, read_message, wrap_handler
 from aiokatcp.core import KatcpSyntaxError, Message
 
 
@@ -236,6 +236,57 @@ async def test_malformed(owner, server_connection, client_writer, caplog) -> Non
     assert re.match("Malformed message received", caplog.records[0].message)
 
 
+async def test_multiple(owner, server_connection, client_writer) -> None:
+    conn = server_connection
+    # Several messages in one chunk, with a mix of line terminators
+    client_writer.write(b"?watchdog[2]\r?watchdog[3]\r\n\n?watchdog[4]\n")
+    client_writer.write_eof()
+    await conn.wait_closed()
+    assert owner.handle_message.mock_calls == [
+        mock.call(conn, Message.request("watchdog", mid=2)),
+        mock.call(conn, Message.request("watchdog", mid=3)),
+        mock.call(conn, Message.request("watchdog", mid=4)),
+    ]
+    # Let the replies go through
+    await asyncio.sleep(1)
+
+
+async def test_unterminated(owner, server_connection, client_writer, caplog) -> None:
+    conn = server_connection
+    client_writer.write(b"?watchdog[2]\n?watchdog")
+    client_writer.write_eof()
+    with caplog.at_level(logging.WARNING, "aiokatcp.connection"):
+        await conn.wait_closed()
+    owner.handle_message.assert_called_once_with(conn, Message.request("watchdog", mid=2))
+    assert len(caplog.records) == 1
+    assert re.match("Malformed message received", caplog.records[0].message)
+    await asyncio.sleep(1)
+
+
+async def test_trailing_whitespace(owner, server_connection, client_writer, caplog) -> None:
+    conn = server_connection
+    client_writer.write(b"?watchdog[2]\n \t")
+    client_writer.write_eof()
+    with caplog.at_level(logging.WARNING, "aiokatcp.connection"):
+        await conn.wait_closed()
+    owner.handle_message.assert_called_once_with(conn, Message.request("watchdog", mid=2))
+    # No "Malformed message received" warning (or #log inform)
+    assert not caplog.records
+    await asyncio.sleep(1)
+
+
+async def test_line_too_long(owner, server_reader, server_writer, client_writer, caplog) -> None:
+    conn = Connection(owner, server_reader, server_writer, True, limit=20)
+    client_writer.write(b"?watchdog[2] " + b"x" * 30 + b"\n?watchdog[3]\n")
+    client_writer.write_eof()
+    with caplog.at_level(logging.WARNING, "aiokatcp.connection"):
+        await conn.wait_closed()
+    owner.handle_message.assert_called_once_with(conn, Message.request("watchdog", mid=3))
+    assert len(caplog.records) == 1
+    assert re.match("Malformed message received", caplog.records[0].message)
+    await asyncio.sleep(1)
+
+
 async def test_close_early(server_connection) -> None:
     conn = server_connection
     conn.close()
@@ -259,3 +310,23 @@ async def test_exception(owner, server_connection, client_writer, caplog) -> Non
     assert len(caplog.records) == 1
     assert re.match("Exception in connection handler", caplog.records[0].message)
     assert re.search("test error", caplog.text)
+
+
+class TestWrapHandler:
+    def test_optional(self) -> None:
+        def handler(ctx, a: int, b: int = 2):
+            return (ctx, a, b)
+
+        wrapper = wrap_handler("test", handler, 1)
+        assert wrapper("ctx", Message.request("test", 1)) == ("ctx", 1, 2)
+        assert wrapper("ctx", Message.request("test", 1, 3)) == ("ctx", 1, 3)
+        with pytest.raises(FailReply, match="missing a required argument"):
+            wrapper("ctx", Message.request("test"))
+
+    def test_required_keyword_only(self) -> None:
+        def handler(ctx, a: int, *, b: int):
+            return (ctx, a, b)
+
+        wrapper = wrap_handler("test", handler, 1)
+        with pytest.raises(FailReply, match="missing a required argument"):
+            wrapper("ctx", Message.request("test", 1))
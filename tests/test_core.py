@@ -28,11 +28,14 @@
 import enum
 import ipaddress
 import json
+import pickle
+import sys
 from fractions import Fraction
 from typing import Union
 
 import pytest
 
+import aiokatcp.core
 from aiokatcp.core import (
     Address,
     KatcpSyntaxError,
@@ -123,10 +126,49 @@ class TestAddress:
         assert hash(self.ADDRESSES["v4_port"]) != hash(self.ADDRESSES["v4_no_port"])
         assert hash(self.ADDRESSES["v4_port"]) != hash(self.ADDRESSES["v6_port"])
 
+    def test_pickle(self, address: Address) -> None:
+        str(address)  # Populate the cached string
+        loaded = pickle.loads(pickle.dumps(address))
+        assert loaded == address
+        assert hash(loaded) == hash(address)
+        assert str(loaded) == str(address)
+
+    @pytest.mark.parametrize(
+        "pickled, address",
+        [
+            (
+                b"\x80\x02caiokatcp.core\nAddress\nq\x00)\x81q\x01N}q\x02(X\x05\x00\x00\x00"
+                b"_hostq\x03cipaddress\nIPv4Address\nq\x04J\x04\x03\x02\x01\x85q\x05Rq\x06"
+                b"X\x05\x00\x00\x00_portq\x07K\x05u\x86q\x08b.",
+                Address(ipaddress.IPv4Address("1.2.3.4"), 5),
+            ),
+            (
+                b"\x80\x02caiokatcp.core\nAddress\nq\x00)\x81q\x01N}q\x02(X\x05\x00\x00\x00"
+                b"_hostq\x03cipaddress\nIPv6Address\nq\x04X\x03\x00\x00\x00::1q\x05\x85q\x06"
+                b"Rq\x07X\x05\x00\x00\x00_portq\x08Nu\x86q\tb.",
+                Address(ipaddress.IPv6Address("::1")),
+            ),
+        ],
+    )
+    def test_unpickle_old(self, pickled: bytes, address: Address) -> None:
+        # Pickled by a version of Address without the cached string
+        loaded = pickle.loads(pickled)
+        assert loaded == address
+        assert hash(loaded) == hash(address)
+        assert str(loaded) == str(address)
+        assert bytes(loaded) == bytes(address)
+
     def test_parse_round_trip(self, address: Address) -> None:
         assert Address.parse(bytes(address)) == address
 
-    @pytest.mark.parametrize("value", [b"", b"[127.0.0.1]", b"::1"])
+    def test_parse_scope_id(self) -> None:
+        # Not supported by inet_pton, so handled by the fallback path
+        address = Address.parse(b"[fe80::1%eth0]:7148")
+        assert address == Address(ipaddress.IPv6Address("fe80::1%eth0"), 7148)
+
+    @pytest.mark.parametrize(
+        "value", [b"", b"[127.0.0.1]", b"::1", b"127.0.0.01", b"[::1\0]", b"\xc3\xa9"]
+    )
     def test_parse_bad(self, value) -> None:
         with pytest.raises(ValueError):
             Address.parse(value)
@@ -176,6 +218,17 @@ class TestEncodeDecode:
     def test_encode(self, type_, value, raw) -> None:
         assert encode(value) == raw
 
+    def test_encode_equal_int_enums(self) -> None:
+        """Members of different IntEnums that compare equal encode separately."""
+
+        class OtherIntEnum(enum.IntEnum):
+            Z = 1
+
+        assert MyIntEnum.A == OtherIntEnum.Z
+        assert encode(MyIntEnum.A) == b"a"
+        assert encode(OtherIntEnum.Z) == b"z"
+        assert encode(MyIntEnum.A) == b"a"
+
     @pytest.mark.parametrize("type_, value, raw", VALUES)
     def test_decode(self, type_, value, raw) -> None:
         assert decode(type_, raw) == value
@@ -218,6 +271,20 @@ class TestEncodeDecode:
                 get_decoder,
             )
 
+    def test_register_type_after_get_type(self, mocker) -> None:
+        """Registering a more specific type overrides a cached lookup."""
+        mocker.patch("aiokatcp.core._types", list(aiokatcp.core._types))
+        mocker.patch("aiokatcp.core._type_cache", {})
+        mocker.patch("aiokatcp.core._encoder_cache", {})
+
+        class MyStr(str):
+            pass
+
+        assert get_type(MyStr).type_ is str
+        register_type(MyStr, "string", lambda value: b"custom", lambda cls: cls)
+        assert get_type(MyStr).type_ is MyStr
+        assert encode(MyStr("hello")) == b"custom"
+
     @pytest.mark.parametrize(
         "type_, default",
         [
@@ -266,7 +333,7 @@ class TestMessage:
         assert msg.arguments == [b"world"]
         assert msg.mid == 345
 
-    @pytest.mark.parametrize("name", ["underscores_bad", "", "1numberfirst"])
+    @pytest.mark.parametrize("name", ["underscores_bad", "", "1numberfirst", "newline\n"])
     def test_init_bad_name(self, name) -> None:
         with pytest.raises(ValueError):
             Message(Message.Type.REPLY, name, "world", mid=345)
@@ -332,6 +399,23 @@ class TestMessage:
         msg = Message.reply("fail", "on fire", mid=234)
         assert bytes(msg) == b"!fail[234] on\\_fire\n"
 
+    @pytest.mark.parametrize(
+        "arg, escaped",
+        [
+            (b"", b"\\@"),
+            (b"plain", b"plain"),
+            (b"_bin ary\xff\x00\n\r\t\\\x1b", b"_bin\\_ary\xff\\0\\n\\r\\t\\\\\\e"),
+        ],
+    )
+    def test_escape_argument(self, arg: bytes, escaped: bytes) -> None:
+        assert Message.escape_argument(arg) == escaped
+        assert Message.unescape_argument(escaped) == arg
+
+    @pytest.mark.parametrize("escaped", [b"bad\\q", b"trailing\\"])
+    def test_unescape_argument_bad(self, escaped: bytes) -> None:
+        with pytest.raises(KatcpSyntaxError):
+            Message.unescape_argument(escaped)
+
     def test_repr(self) -> None:
         msg = Message.reply("fail", "on fire", mid=234)
         assert repr(msg) == "Message(Message.Type.REPLY, 'fail', b'on fire', mid=234)"
@@ -357,6 +441,26 @@ class TestMessage:
         assert msg == Message.request("test", b"message", b"\0\n\r\t\x1b binary", mid=222)
         msg = Message.parse(b"?test[1] message\n")
         assert msg == Message.request("test", b"message", mid=1)
+        msg = Message.parse(b"?test[2147483647] message\n")
+        assert msg == Message.request("test", b"message", mid=2**31 - 1)
+
+    def test_parse_name_interned(self) -> None:
+        msg1 = Message.parse(b"?test-interned\n")
+        msg2 = Message.parse(b"!test-interned ok\n")
+        assert msg1.name == "test-interned"
+        assert msg1.name is msg2.name
+
+    def test_parse_name_cache_full(self, mocker) -> None:
+        mocker.patch.object(Message, "_NAME_CACHE", {})
+        mocker.patch.object(Message, "_NAME_CACHE_SIZE", 2)
+        Message.parse(b"?test-cache-full-a\n")
+        Message.parse(b"?test-cache-full-b\n")
+        msg = Message.parse(b"?test-cache-full-c\n")
+        assert msg.name == "test-cache-full-c"
+        assert len(Message._NAME_CACHE) == 2
+        # Build an equal string at runtime (so that it's not interned by the
+        # compiler). If msg.name were interned, this would return it.
+        assert sys.intern("-".join(["test", "cache", "full", "c"])) is not msg.name
 
     @pytest.mark.parametrize(
         "msg",
@@ -368,6 +472,8 @@ class TestMessage:
             pytest.param(b"?bad_name message", id="Underscore in name"),
             pytest.param(b"? message", id="Empty name"),
             pytest.param(b"!ok[1000000000000]\n", id="MID out of range"),
+            pytest.param(b"!ok[2147483648]\n", id="MID just out of range"),
+            pytest.param(b"!ok[01]\n", id="MID has leading zero"),
             pytest.param(b"!ok[0]\n", id="MID is zero"),
             pytest.param(b"!ok[10\n", id="MID not terminated"),
             pytest.param(b"!ok[a]\n", id="MID not an integer"),
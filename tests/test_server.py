@@ -543,6 +543,30 @@ async def test_mass_inform(server: DummyServer, reader: asyncio.StreamReader) ->
     assert await reader.readline() == b"#test-inform 123\n"
 
 
+async def test_mass_send_message(server: DummyServer, reader: asyncio.StreamReader) -> None:
+    msg = aiokatcp.Message.inform("test-inform", 123)
+    server.mass_send_message(msg)
+    server.mass_send_message(msg)
+    assert await reader.readline() == b"#test-inform 123\n"
+    assert await reader.readline() == b"#test-inform 123\n"
+
+
+async def test_mass_inform_multiple_clients(
+    server: DummyServer,
+    reader_writer_factory: Callable[[], Awaitable[_StreamPair]],
+    mocker,
+) -> None:
+    """The inform is sent to every client, but only serialised once."""
+    reader1, _ = await reader_writer_factory()
+    reader2, _ = await reader_writer_factory()
+    await reader1.readline()  # Discard the #client-connected
+    spy = mocker.spy(aiokatcp.Message, "__bytes__")
+    server.mass_inform("test-inform", 123)
+    assert await reader1.readline() == b"#test-inform 123\n"
+    assert await reader2.readline() == b"#test-inform 123\n"
+    assert spy.call_count == 1
+
+
 async def test_log_level(
     server: DummyServer,
     reader: asyncio.StreamReader,